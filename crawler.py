@@ -1,22 +1,129 @@
-import requests
+import asyncio
+import aiohttp
 import json
 import re
 import sqlite3
 import hashlib
+import math
+import multiprocessing
+import zlib
 from datetime import datetime
-import time
 import os
-from bs4 import BeautifulSoup
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, ClassVar, Dict, List, Mapping, Optional, Pattern, Tuple, final
+from urllib.parse import urlsplit
+from bs4 import BeautifulSoup, Tag
+
+# 列表页接口返回的单条新闻（title, brief, focus_date, keywords, url 等字段）
+NewsItem = Dict[str, Any]
+
+def _init_parse_worker() -> None:
+    """解析进程初始化：预先加载 lxml 解析器"""
+    BeautifulSoup(b'<html></html>', 'lxml')
+
+def _parse_detail(body: bytes) -> Optional[str]:
+    """从详细页HTML中提取正文，在解析进程中运行；未找到内容区域时返回None"""
+    # 直接交给 libxml2 (C实现) 解析字节内容，省去单独的解码步骤
+    soup = BeautifulSoup(body, 'lxml', from_encoding='utf-8')
+    
+    # 查找内容区域
+    content_area = soup.find('div', id='content_area')
+    if not isinstance(content_area, Tag):
+        return None
+    
+    # 去掉脚本和样式后一次性提取纯文本，每段文字一行
+    for tag in content_area.select('script, style'):
+        tag.decompose()
+    
+    return content_area.get_text(separator='\n', strip=True)
+
+class HostRateLimiter:
+    """按主机限制请求间隔，并遵循服务端返回的 Retry-After 头"""
+    def __init__(self, min_interval: float = 0.1) -> None:
+        self.min_interval = min_interval
+        self._next_time: Dict[str, float] = {}
+        self._locks: Dict[str, asyncio.Lock] = {}
+    
+    async def wait(self, host: str) -> None:
+        """等待直到该主机允许发出下一个请求"""
+        lock = self._locks.setdefault(host, asyncio.Lock())
+        async with lock:
+            now = asyncio.get_running_loop().time()
+            next_time = self._next_time.get(host, now)
+            if next_time > now:
+                await asyncio.sleep(next_time - now)
+                now = next_time
+            self._next_time[host] = now + self.min_interval
+    
+    def update(self, host: str, headers: Mapping[str, str]) -> None:
+        """根据响应头推迟该主机的下一次请求"""
+        retry_after = headers.get('Retry-After', '')
+        if retry_after.isdigit():
+            resume_time = asyncio.get_running_loop().time() + int(retry_after)
+            self._next_time[host] = max(self._next_time.get(host, 0.0), resume_time)
+
+class HashBloomFilter:
+    """基于内容哈希的布隆过滤器，用于判断新闻是否一定尚未入库"""
+    def __init__(self, capacity: int = 200000, error_rate: float = 1e-5) -> None:
+        self.size = int(-capacity * math.log(error_rate) / (math.log(2) ** 2))
+        self.num_hashes = max(1, round(self.size / capacity * math.log(2)))
+        self._bits = bytearray((self.size + 7) // 8)
+    
+    def _positions(self, content_hash: str) -> List[int]:
+        """内容哈希本身已均匀分布，拆成两半做双重哈希，无需再次计算哈希"""
+        half = len(content_hash) // 2
+        h1 = int(content_hash[:half], 16)
+        h2 = int(content_hash[half:], 16) | 1
+        return [(h1 + i * h2) % self.size for i in range(self.num_hashes)]
+    
+    def add(self, content_hash: str) -> None:
+        for pos in self._positions(content_hash):
+            self._bits[pos >> 3] |= 1 << (pos & 7)
+    
+    def __contains__(self, content_hash: str) -> bool:
+        return all(self._bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(content_hash))
 
 class CCTVNewsCrawler:
-    def __init__(self, db_path='cctv_news.db', content_base_dir='news'):
+    LIST_URL = "https://news.cctv.com/2019/07/gaiban/cmsdatainterface/page/world_{}.jsonp"
+    HEADERS: ClassVar[Dict[str, str]] = {
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+    }
+    MAX_CONCURRENCY = 16  # 每个主机的最大并发请求数
+    MAX_RETRIES = 3
+    BACKOFF_FACTOR = 0.3
+    RETRY_STATUSES = (429, 500, 502, 503, 504)
+    COMPRESS_LEVEL = 3  # 中文正文压缩率已足够，更高级别收益很小
+    MAX_SQL_VARIABLES = 500  # 单条语句的参数个数，低于旧版SQLite的999上限
+    _JSONP_RE: ClassVar[Pattern[bytes]] = re.compile(rb'\{.*\}', re.DOTALL)
+    SCHEMA_VERSION = 3  # 对应 PRAGMA user_version，见 _migrate
+    
+    def __init__(self, db_path: str = 'cctv_news.db', content_base_dir: str = 'news') -> None:
         self.db_path = db_path
+        # 新的详细内容已存入数据库，此参数仅为兼容旧的调用方式而保留
         self.content_base_dir = content_base_dir
+        # 以下三项仅在 run_crawler_async 运行期间有效
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._rate_limiter: Optional[HostRateLimiter] = None
+        self._parse_pool: Optional[ProcessPoolExecutor] = None
+        self.bloom = HashBloomFilter()
         self.init_database()
+        self._load_bloom_filter()
     
-    def init_database(self):
-        """初始化数据库结构"""
+    def _connect(self) -> sqlite3.Connection:
+        """打开数据库连接并应用性能相关的PRAGMA"""
         conn = sqlite3.connect(self.db_path)
+        # 详细内容以BLOB存放，较大的页可减少溢出页；仅对新建的数据库生效
+        conn.execute('PRAGMA page_size=8192')
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        conn.execute('PRAGMA cache_size=-65536')
+        conn.execute('PRAGMA temp_store=MEMORY')
+        conn.execute('PRAGMA mmap_size=268435456')
+        return conn
+    
+    def init_database(self) -> None:
+        """初始化数据库结构"""
+        conn = self._connect()
         c = conn.cursor()
         
         c.execute('''
@@ -27,213 +134,296 @@ class CCTVNewsCrawler:
                 publish_time TEXT,
                 keywords TEXT,
                 crawl_time TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                content_file_path TEXT
+                content_file_path TEXT,
+                content_blob BLOB
             )
         ''')
         
-        c.execute('CREATE INDEX IF NOT EXISTS idx_publish_time ON news(publish_time)')
         c.execute('CREATE INDEX IF NOT EXISTS idx_crawl_time ON news(crawl_time)')
+        # 查看器按 (publish_time, content_hash) 做键集分页，按 publish_time 的排序和范围查询也走此索引
+        c.execute('CREATE INDEX IF NOT EXISTS idx_pub_hash ON news(publish_time DESC, content_hash DESC)')
+        # 查看器统计按 DATE(publish_time) 分组，表达式索引可免去全表扫描和临时排序
+        c.execute('CREATE INDEX IF NOT EXISTS idx_news_date ON news(DATE(publish_time))')
+        
+        self._init_fulltext_index(c)
+        self._migrate(c)
         
         conn.commit()
         conn.close()
     
-    def get_content_hash(self, news_item):
+    def _migrate(self, c: sqlite3.Cursor) -> None:
+        """根据 PRAGMA user_version 执行一次性数据迁移"""
+        c.execute('PRAGMA user_version')
+        version = c.fetchone()[0]
+        
+        if version < 1:
+            # 内容哈希由 MD5 改为 BLAKE2b，按标题和摘要重新计算已有记录的哈希
+            # （已保存的详细内容文件保留原文件名，路径仍记录在 content_file_path 中）
+            c.execute('SELECT rowid, title, summary FROM news')
+            rehashed = [(self._hash_content(title, summary), rowid) for rowid, title, summary in c.fetchall()]
+            c.executemany('UPDATE news SET content_hash = ? WHERE rowid = ?', rehashed)
+        
+        if version < 2:
+            # 详细内容改为zlib压缩后存入 content_blob，早期记录仍使用 content_file_path 指向的文件
+            c.execute('PRAGMA table_info(news)')
+            if 'content_blob' not in [column[1] for column in c.fetchall()]:
+                c.execute('ALTER TABLE news ADD COLUMN content_blob BLOB')
+        
+        if version < 3:
+            # idx_pub_hash 以 publish_time 开头，单列索引 idx_publish_time 已多余，只会增加写入开销
+            c.execute('DROP INDEX IF EXISTS idx_publish_time')
+        
+        if version < self.SCHEMA_VERSION:
+            c.execute(f'PRAGMA user_version = {self.SCHEMA_VERSION}')
+    
+    def _init_fulltext_index(self, c: sqlite3.Cursor) -> None:
+        """创建标题/摘要/关键词的FTS5全文索引（trigram分词，支持中文子串检索）"""
+        c.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'news_fts'")
+        if c.fetchone():
+            return
+        
+        try:
+            c.execute('''
+                CREATE VIRTUAL TABLE news_fts USING fts5(
+                    title, summary, keywords,
+                    content='news', content_rowid='rowid', tokenize='trigram'
+                )
+            ''')
+        except sqlite3.OperationalError as e:
+            print(f"当前SQLite不支持FTS5 trigram分词，搜索将使用LIKE匹配: {e}")
+            return
+        
+        # 通过触发器保持全文索引与 news 表同步
+        c.execute('''
+            CREATE TRIGGER IF NOT EXISTS news_fts_insert AFTER INSERT ON news BEGIN
+                INSERT INTO news_fts(rowid, title, summary, keywords)
+                VALUES (new.rowid, new.title, new.summary, new.keywords);
+            END
+        ''')
+        c.execute('''
+            CREATE TRIGGER IF NOT EXISTS news_fts_delete AFTER DELETE ON news BEGIN
+                INSERT INTO news_fts(news_fts, rowid, title, summary, keywords)
+                VALUES ('delete', old.rowid, old.title, old.summary, old.keywords);
+            END
+        ''')
+        c.execute('''
+            CREATE TRIGGER IF NOT EXISTS news_fts_update AFTER UPDATE OF title, summary, keywords ON news BEGIN
+                INSERT INTO news_fts(news_fts, rowid, title, summary, keywords)
+                VALUES ('delete', old.rowid, old.title, old.summary, old.keywords);
+                INSERT INTO news_fts(rowid, title, summary, keywords)
+                VALUES (new.rowid, new.title, new.summary, new.keywords);
+            END
+        ''')
+        
+        # 为已有数据建立索引
+        c.execute("INSERT INTO news_fts(news_fts) VALUES ('rebuild')")
+    
+    def _load_bloom_filter(self) -> None:
+        """启动时用已入库的内容哈希填充布隆过滤器"""
+        conn = self._connect()
+        for (content_hash,) in conn.execute('SELECT content_hash FROM news'):
+            self.bloom.add(content_hash)
+        conn.close()
+    
+    @final
+    def _hash_content(self, title: str, summary: str) -> str:
+        """BLAKE2b 128位摘要，与原MD5哈希同为32位十六进制字符串"""
+        content = f"{title}{summary}"
+        return hashlib.blake2b(content.encode('utf-8'), digest_size=16).hexdigest()
+    
+    @final
+    def get_content_hash(self, news_item: NewsItem) -> str:
         """基于标题和摘要生成内容哈希"""
-        content = f"{news_item['title']}{news_item['brief']}"
-        return hashlib.md5(content.encode('utf-8')).hexdigest()
+        return self._hash_content(news_item['title'], news_item['brief'])
+    
+    async def _request(self, session: aiohttp.ClientSession, url: str, host: str,
+                       headers: Optional[Dict[str, str]] = None) -> Tuple[int, Optional[bytes]]:
+        """发送一次受并发数和主机限速约束的GET请求，返回 (状态码, 响应内容)"""
+        semaphore, rate_limiter = self._semaphore, self._rate_limiter
+        assert semaphore is not None and rate_limiter is not None, "只能在 run_crawler_async 运行期间发送请求"
+        
+        async with semaphore:
+            await rate_limiter.wait(host)
+            async with session.get(url, headers=headers, timeout=aiohttp.ClientTimeout(total=10)) as response:
+                rate_limiter.update(host, response.headers)
+                if response.status != 200:
+                    return response.status, None
+                return response.status, await response.read()
     
-    def fetch_news_page(self, page_num):
+    async def _fetch(self, session: aiohttp.ClientSession, url: str,
+                     headers: Optional[Dict[str, str]] = None) -> Tuple[int, Optional[bytes]]:
+        """GET请求，连接失败或服务端临时错误时按指数退避重试，最后一次的结果原样返回"""
+        host = urlsplit(url).hostname or ''
+        for attempt in range(self.MAX_RETRIES):
+            try:
+                status, body = await self._request(session, url, host, headers)
+                if status not in self.RETRY_STATUSES:
+                    return status, body
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                pass
+            await asyncio.sleep(self.BACKOFF_FACTOR * (2 ** attempt))
+        
+        return await self._request(session, url, host, headers)
+    
+    async def fetch_news_page(self, session: aiohttp.ClientSession, page_num: int) -> List[NewsItem]:
         """获取新闻列表页数据"""
-        api_url = f"https://news.cctv.com/2019/07/gaiban/cmsdatainterface/page/world_{page_num}.jsonp"
+        api_url = self.LIST_URL.format(page_num)
         
         headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
             'Referer': 'https://news.cctv.com/world/',
             'Accept': '*/*'
         }
         
         try:
             print(f"正在获取第 {page_num} 页数据...")
-            response = requests.get(api_url, headers=headers, timeout=10)
-            response.encoding = 'utf-8'
+            status, body = await self._fetch(session, api_url, headers=headers)
             
-            if response.status_code == 200:
-                news_list = self.parse_jsonp(response.text)[:10]
+            if body is not None:
+                news_list = self.parse_jsonp(body)[:10]
                 print(f"第 {page_num} 页获取到 {len(news_list)} 条新闻")
                 return news_list
             else:
-                print(f"第 {page_num} 页请求失败，状态码: {response.status_code}")
+                print(f"第 {page_num} 页请求失败，状态码: {status}")
                 return []
                 
         except Exception as e:
             print(f"获取第 {page_num} 页数据失败: {e}")
             return []
     
-    def parse_jsonp(self, jsonp_data):
-        """解析JSONP数据"""
+    def parse_jsonp(self, jsonp_data: bytes) -> List[NewsItem]:
+        """解析JSONP数据（字节串，直接截取JSON部分交给json.loads）"""
         try:
-            json_str = re.search(r'\{.*\}', jsonp_data).group()
-            data = json.loads(json_str)
+            match = self._JSONP_RE.search(jsonp_data)
+            if match is None:
+                raise ValueError("未找到JSON内容")
+            data = json.loads(match.group())
             return data['data']['list']
         except Exception as e:
             print(f"解析JSONP数据失败: {e}")
             return []
     
-    def fetch_detailed_content(self, url):
+    async def fetch_detailed_content(self, session: aiohttp.ClientSession, url: str) -> Optional[str]:
         """获取新闻详细内容"""
         headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8'
         }
         
         try:
-            response = requests.get(url, headers=headers, timeout=10)
-            response.encoding = 'utf-8'
+            status, body = await self._fetch(session, url, headers=headers)
             
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.text, 'html.parser')
-                
-                # 查找内容区域
-                content_area = soup.find('div', id='content_area')
-                if content_area:
-                    # 提取纯文本内容，保留段落结构
-                    content_text = ""
-                    for element in content_area.find_all(['p', 'div']):
-                        text = element.get_text(strip=True)
-                        if text:
-                            content_text += text + "\n"
-                    
-                    return content_text.strip()
-                else:
+            if body is not None:
+                # HTML解析是CPU密集型工作，交给进程池以利用多核
+                loop = asyncio.get_running_loop()
+                content_text = await loop.run_in_executor(self._parse_pool, _parse_detail, body)
+                if content_text is None:
                     print(f"未找到内容区域: {url}")
-                    return None
+                return content_text or None
             else:
-                print(f"获取详细内容失败，状态码: {response.status_code}, URL: {url}")
+                print(f"获取详细内容失败，状态码: {status}, URL: {url}")
                 return None
                 
         except Exception as e:
             print(f"获取详细内容异常: {e}, URL: {url}")
             return None
     
-    def get_content_file_path(self, content_hash, publish_time):
-        """根据发布时间生成文件路径"""
-        try:
-            # 解析发布时间
-            dt = datetime.strptime(publish_time, '%Y-%m-%d %H:%M:%S')
-            year = dt.strftime('%Y')
-            month = dt.strftime('%m')
-            day = dt.strftime('%d')
-            
-            # 创建目录结构
-            dir_path = os.path.join(self.content_base_dir, year, month, day)
-            os.makedirs(dir_path, exist_ok=True)
-            
-            # 返回相对路径
-            return os.path.join(year, month, day, f"{content_hash}.txt")
-            
-        except:
-            # 如果时间解析失败，使用当前日期
-            today = datetime.now()
-            year = today.strftime('%Y')
-            month = today.strftime('%m')
-            day = today.strftime('%d')
-            
-            dir_path = os.path.join(self.content_base_dir, year, month, day)
-            os.makedirs(dir_path, exist_ok=True)
-            
-            return os.path.join(year, month, day, f"{content_hash}.txt")
-    
-    def save_detailed_content(self, file_path, detailed_content):
-        """保存详细内容到txt文件"""
+    async def fetch_detail_blob(self, session: aiohttp.ClientSession, news_item: NewsItem) -> Optional[bytes]:
+        """获取详细内容并压缩为BLOB，失败返回None"""
+        print(f"获取详细内容: {news_item['title'][:30]}...")
+        detailed_content = await self.fetch_detailed_content(session, news_item['url'])
         if not detailed_content:
-            return False
+            return None
+        return zlib.compress(detailed_content.encode('utf-8'), self.COMPRESS_LEVEL)
+    
+    def _group_by_hash(self, news_list: List[NewsItem]) -> Dict[str, NewsItem]:
+        """按内容哈希去重（同一新闻可能出现在多个列表页），返回 内容哈希 -> 新闻 的映射"""
+        news_by_hash: Dict[str, NewsItem] = {}
+        for news_item in news_list:
+            news_by_hash.setdefault(self.get_content_hash(news_item), news_item)
+        return news_by_hash
+    
+    def _query_existing(self, c: sqlite3.Cursor, hashes: List[str]) -> Dict[str, bool]:
+        """批量查询已存在的记录，返回 内容哈希 -> 是否已有详细内容 的映射"""
+        existing_map: Dict[str, bool] = {}
+        # 布隆过滤器判定不存在的哈希一定是新记录，只需查询可能重复的部分
+        hashes = [content_hash for content_hash in hashes if content_hash in self.bloom]
+        for i in range(0, len(hashes), self.MAX_SQL_VARIABLES):
+            chunk = hashes[i:i + self.MAX_SQL_VARIABLES]
+            placeholders = ','.join('?' * len(chunk))
+            c.execute(f'''
+                SELECT content_hash, content_file_path IS NOT NULL OR content_blob IS NOT NULL
+                FROM news WHERE content_hash IN ({placeholders})
+            ''', chunk)
+            existing_map.update((content_hash, bool(has_detail)) for content_hash, has_detail in c.fetchall())
+        return existing_map
+    
+    def get_pending_news(self, news_list: List[NewsItem]) -> Dict[str, NewsItem]:
+        """筛选出尚未获取详细内容的新闻，返回 内容哈希 -> 新闻 的映射"""
+        news_by_hash = self._group_by_hash(news_list)
         
-        full_path = os.path.join(self.content_base_dir, file_path)
+        conn = self._connect()
+        existing_map = self._query_existing(conn.cursor(), list(news_by_hash))
+        conn.close()
         
-        try:
-            with open(full_path, 'w', encoding='utf-8') as f:
-                f.write(detailed_content)
-            return True
-        except Exception as e:
-            print(f"保存详细内容失败: {e}")
-            return False
+        return {content_hash: news_item for content_hash, news_item in news_by_hash.items()
+                if not existing_map.get(content_hash)}
     
-    def save_news_to_db(self, news_list, fetch_detailed=True):
-        """保存新闻到数据库"""
-        conn = sqlite3.connect(self.db_path)
+    def save_news_to_db(self, news_list: List[NewsItem],
+                        content_blobs: Optional[Dict[str, bytes]] = None) -> Tuple[int, int]:
+        """保存新闻到数据库，content_blobs 为 内容哈希 -> 压缩后的详细内容 的映射
+        
+        返回 (新增/更新数, 重复数)；写入失败时整批回滚并返回 (0, 0)
+        """
+        conn = self._connect()
         c = conn.cursor()
         
-        new_count = 0
-        duplicate_count = 0
+        news_by_hash = self._group_by_hash(news_list)
+        content_blobs = content_blobs or {}
+        rows = [(
+            content_hash,
+            news_item['title'],
+            news_item['brief'],
+            news_item.get('focus_date'),
+            news_item.get('keywords', ''),
+            content_blobs.get(content_hash)
+        ) for content_hash, news_item in news_by_hash.items()]
         
-        for news_item in news_list:
-            content_hash = self.get_content_hash(news_item)
-            
-            # 检查是否已存在
-            c.execute('SELECT content_file_path FROM news WHERE content_hash = ?', (content_hash,))
-            existing = c.fetchone()
-            
-            content_file_path = None
-            
-            # 如果需要获取详细内容且尚未获取
-            if fetch_detailed and (not existing or not existing[0]):
-                print(f"获取详细内容: {news_item['title'][:30]}...")
-                detailed_content = self.fetch_detailed_content(news_item['url'])
-                if detailed_content:
-                    content_file_path = self.get_content_file_path(content_hash, news_item['focus_date'])
-                    if not self.save_detailed_content(content_file_path, detailed_content):
-                        content_file_path = None
-                time.sleep(1)  # 请求间隔
-            elif existing:
-                content_file_path = existing[0]
-            
-            try:
-                if existing:
-                    # 更新记录（如果之前没有详细内容，现在有了）
-                    if content_file_path and not existing[0]:
-                        c.execute('''
-                            UPDATE news 
-                            SET content_file_path = ?, crawl_time = CURRENT_TIMESTAMP
-                            WHERE content_hash = ?
-                        ''', (content_file_path, content_hash))
-                        new_count += 1  # 算作新增详细内容
-                    else:
-                        duplicate_count += 1
-                else:
-                    # 插入新记录
-                    c.execute('''
-                        INSERT INTO news 
-                        (content_hash, title, summary, publish_time, keywords, content_file_path)
-                        VALUES (?, ?, ?, ?, ?, ?)
-                    ''', (
-                        content_hash,
-                        news_item['title'],
-                        news_item['brief'],
-                        news_item['focus_date'],
-                        news_item.get('keywords', ''),
-                        content_file_path
-                    ))
-                    new_count += 1
-                
-            except Exception as e:
-                print(f"保存新闻失败: {news_item['title']}, 错误: {e}")
+        # 新记录直接插入；已存在的记录仅在之前没有、现在有了详细内容时更新，
+        # 其余冲突不做任何修改。rowcount 只统计实际插入或更新的行数
+        try:
+            with conn:
+                c.executemany('''
+                    INSERT INTO news 
+                    (content_hash, title, summary, publish_time, keywords, content_blob)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                    ON CONFLICT(content_hash) DO UPDATE
+                    SET content_blob = excluded.content_blob, crawl_time = CURRENT_TIMESTAMP
+                    WHERE news.content_file_path IS NULL AND news.content_blob IS NULL
+                        AND excluded.content_blob IS NOT NULL
+                ''', rows)
+        except sqlite3.Error as e:
+            print(f"保存新闻失败: {e}")
+            conn.close()
+            return 0, 0
         
-        conn.commit()
+        new_count = c.rowcount
         conn.close()
         
-        return new_count, duplicate_count
+        for row in rows:
+            self.bloom.add(row[0])
+        
+        return new_count, len(news_list) - new_count
     
-    def get_statistics(self):
+    def get_statistics(self) -> Dict[str, Any]:
         """获取统计信息"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         c = conn.cursor()
         
-        stats = {}
+        stats: Dict[str, Any] = {}
         
         c.execute('SELECT COUNT(*) FROM news')
         stats['total_count'] = c.fetchone()[0]
         
-        c.execute('SELECT COUNT(*) FROM news WHERE content_file_path IS NOT NULL')
+        c.execute('SELECT COUNT(*) FROM news WHERE content_file_path IS NOT NULL OR content_blob IS NOT NULL')
         stats['detailed_count'] = c.fetchone()[0]
         
         c.execute('SELECT MIN(publish_time), MAX(publish_time) FROM news')
@@ -242,24 +432,54 @@ class CCTVNewsCrawler:
         conn.close()
         return stats
     
-    def run_crawler(self, fetch_detailed=True, max_pages=3):
-        """运行爬虫"""
+    async def run_crawler_async(self, fetch_detailed: bool = True, max_pages: int = 3) -> None:
+        """运行爬虫（并发获取列表页和详细内容）"""
         print(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - 开始爬取新闻...")
         
-        all_news = []
-        for page_num in range(1, max_pages + 1):
-            page_news = self.fetch_news_page(page_num)
-            if page_news:
-                all_news.extend(page_news)
-            time.sleep(0.5)
-        
-        if not all_news:
-            print("未获取到任何新闻数据")
-            return
+        self._semaphore = asyncio.Semaphore(self.MAX_CONCURRENCY)
+        self._rate_limiter = HostRateLimiter()
+        # 所有请求共用一个连接池，复用到同一主机的TCP/TLS连接
+        connector = aiohttp.TCPConnector(limit_per_host=self.MAX_CONCURRENCY, ttl_dns_cache=300)
         
-        print(f"获取到 {len(all_news)} 条新闻，开始处理详细内容..." if fetch_detailed else f"获取到 {len(all_news)} 条新闻")
+        # 解析进程在首次提交任务时才启动，此时事件循环的线程池已在运行（如DNS解析），
+        # fork 多线程进程可能使子进程死锁，因此统一用 spawn 启动
+        self._parse_pool = ProcessPoolExecutor(max_workers=os.cpu_count(), initializer=_init_parse_worker,
+                                               mp_context=multiprocessing.get_context('spawn'))
+        try:
+            async with aiohttp.ClientSession(connector=connector, headers=self.HEADERS) as session:
+                pages = await asyncio.gather(*[
+                    self.fetch_news_page(session, page_num) for page_num in range(1, max_pages + 1)
+                ])
+                all_news: List[NewsItem] = []
+                for page_news in pages:
+                    for news_item in page_news:
+                        # 标题和摘要为 NOT NULL 列，缺失的条目在哈希和获取详细内容之前就跳过
+                        if news_item.get('title') is None or news_item.get('brief') is None:
+                            print(f"保存新闻失败: {news_item.get('title')}, 错误: 缺少标题或摘要")
+                            continue
+                        all_news.append(news_item)
+                
+                if not all_news:
+                    print("未获取到任何新闻数据")
+                    return
+                
+                print(f"获取到 {len(all_news)} 条新闻，开始处理详细内容..." if fetch_detailed else f"获取到 {len(all_news)} 条新闻")
+                
+                content_blobs: Dict[str, bytes] = {}
+                if fetch_detailed:
+                    pending = self.get_pending_news(all_news)
+                    blobs = await asyncio.gather(*[
+                        self.fetch_detail_blob(session, news_item) for news_item in pending.values()
+                    ])
+                    content_blobs = {content_hash: blob
+                                     for content_hash, blob in zip(pending, blobs) if blob}
+        finally:
+            self._parse_pool.shutdown()
+            self._parse_pool = None
         
-        new_count, duplicate_count = self.save_news_to_db(all_news, fetch_detailed)
+        new_count, duplicate_count = self.save_news_to_db(all_news, content_blobs)
+        if new_count == duplicate_count == 0:
+            print("⚠️ 本次获取的新闻未能写入数据库")
         
         # 显示统计
         stats = self.get_statistics()
@@ -269,11 +489,15 @@ class CCTVNewsCrawler:
         print(f"   数据库总数: {stats['total_count']} 条")
         print(f"   含详细内容: {stats['detailed_count']} 条")
         print(f"   时间范围: {stats['time_range'][0]} 到 {stats['time_range'][1]}")
+    
+    def run_crawler(self, fetch_detailed: bool = True, max_pages: int = 3) -> None:
+        """运行爬虫（同步入口）"""
+        asyncio.run(self.run_crawler_async(fetch_detailed, max_pages))
 
-def main():
+def main() -> None:
     """爬虫主函数"""
     crawler = CCTVNewsCrawler()
-    crawler.run_crawler(fetch_detailed=True, max_pages=7)
+    asyncio.run(crawler.run_crawler_async(fetch_detailed=True, max_pages=7))
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,16 @@
+# 可选：用 mypyc 将 crawler.py 提前编译为C扩展，热点循环（哈希、布隆过滤、列表分组）可提速
+# 编译：pip install mypy && python setup.py build_ext --inplace
+# 未安装 mypy 时按纯Python模块安装；直接运行 crawler.py 也可，行为一致
+from setuptools import setup
+
+try:
+    from mypyc.build import mypycify
+    ext_modules = mypycify(['crawler.py'])
+except ImportError:
+    ext_modules = []
+
+setup(
+    name='cctv-news',
+    py_modules=['crawler', 'viewer'],
+    ext_modules=ext_modules,
+)
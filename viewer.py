@@ -1,133 +1,183 @@
 import sqlite3
 import os
+import shutil
+import sys
+import zlib
 from datetime import datetime, timedelta
 
 class NewsViewer:
     def __init__(self, db_path='cctv_news_simple.db', content_base_dir='news'):
         self.db_path = db_path
         self.content_base_dir = content_base_dir
+        # 查看器生命周期内共用一个连接，PRAGMA 只需设置一次
+        self.conn = self._connect()
+        # 尚未经爬虫迁移的旧数据库没有 content_blob 列，查询时以 NULL 代替
+        self._blob_column = 'content_blob' if self._has_blob_column() else 'NULL'
     
-    def view_recent_news(self, limit=10):
-        """查看最近新闻"""
+    def close(self):
+        """关闭数据库连接"""
+        self.conn.close()
+    
+    def _connect(self):
+        """打开数据库连接并应用性能相关的PRAGMA"""
         conn = sqlite3.connect(self.db_path)
-        c = conn.cursor()
+        conn.row_factory = sqlite3.Row
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        conn.execute('PRAGMA cache_size=-65536')
+        conn.execute('PRAGMA temp_store=MEMORY')
+        conn.execute('PRAGMA mmap_size=268435456')
+        return conn
+    
+    def _has_blob_column(self):
+        """news 表中是否已有存放压缩详细内容的 content_blob 列"""
+        columns = self.conn.execute('PRAGMA table_info(news)').fetchall()
+        return any(column['name'] == 'content_blob' for column in columns)
+    
+    def _has_fulltext_index(self, c):
+        """数据库中是否已由爬虫建立全文索引"""
+        c.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'news_fts'")
+        return c.fetchone() is not None
+    
+    def _print_news_list(self, header, rows, show_summary=False):
+        """将整页结果拼接成一个字符串后一次性输出"""
+        lines = [f"\n=== {header} ===\n"]
+        for i, row in enumerate(rows, 1):
+            lines.append(f"{i}. {row['title']}")
+            lines.append(f"   时间: {row['publish_time']}")
+            lines.append(f"   关键词: {row['keywords']}")
+            if show_summary:
+                lines.append(f"   摘要: {row['summary']}")
+            lines.append(f"   哈希: {row['content_hash']}")
+            lines.append(f"   详细内容: {'✅' if row['has_detail'] else '❌'}")
+            lines.append("")
+        sys.stdout.write("\n".join(lines) + "\n")
+    
+    def view_recent_news(self, limit=10, before=None):
+        """查看最近新闻，before 为上一页最后一条的 (发布时间, 内容哈希)，用于键集分页"""
+        c = self.conn.cursor()
         
-        c.execute('''
-            SELECT content_hash, title, summary, publish_time, keywords, content_file_path
-            FROM news 
-            ORDER BY publish_time DESC 
-            LIMIT ?
-        ''', (limit,))
+        if before:
+            c.execute(f'''
+                SELECT content_hash, title, summary, publish_time, keywords,
+                       content_file_path IS NOT NULL OR {self._blob_column} IS NOT NULL AS has_detail
+                FROM news 
+                WHERE (publish_time, content_hash) < (?, ?)
+                ORDER BY publish_time DESC, content_hash DESC 
+                LIMIT ?
+            ''', (*before, limit))
+        else:
+            c.execute(f'''
+                SELECT content_hash, title, summary, publish_time, keywords,
+                       content_file_path IS NOT NULL OR {self._blob_column} IS NOT NULL AS has_detail
+                FROM news 
+                ORDER BY publish_time DESC, content_hash DESC 
+                LIMIT ?
+            ''', (limit,))
         
         news_list = c.fetchall()
-        conn.close()
         
-        print(f"\n=== 最近 {len(news_list)} 条新闻 ===\n")
-        
-        for i, (content_hash, title, summary, pub_time, keywords, file_path) in enumerate(news_list, 1):
-            print(f"{i}. {title}")
-            print(f"   时间: {pub_time}")
-            print(f"   关键词: {keywords}")
-            print(f"   摘要: {summary}")
-            print(f"   哈希: {content_hash}")
-            print(f"   详细内容: {'✅' if file_path else '❌'}")
-            print()
+        self._print_news_list(f"最近 {len(news_list)} 条新闻", news_list, show_summary=True)
         
         return news_list
     
-    def view_news_by_date(self, date_str, limit=20):
-        """按日期查看新闻"""
-        conn = sqlite3.connect(self.db_path)
-        c = conn.cursor()
+    def view_news_by_date(self, date_str, limit=20, before=None):
+        """按日期查看新闻，before 含义同 view_recent_news"""
+        try:
+            day = datetime.strptime(date_str, '%Y-%m-%d')
+        except ValueError:
+            print("日期格式错误，应为 YYYY-MM-DD")
+            return []
         
-        c.execute('''
-            SELECT content_hash, title, summary, publish_time, keywords, content_file_path
+        # 用 [当天, 次日) 的范围代替 DATE(publish_time) = ?，可直接走索引范围扫描
+        start = day.strftime('%Y-%m-%d')
+        before = before or ((day + timedelta(days=1)).strftime('%Y-%m-%d'), '')
+        
+        c = self.conn.cursor()
+        
+        c.execute(f'''
+            SELECT content_hash, title, summary, publish_time, keywords,
+                   content_file_path IS NOT NULL OR {self._blob_column} IS NOT NULL AS has_detail
             FROM news 
-            WHERE DATE(publish_time) = ?
-            ORDER BY publish_time DESC 
+            WHERE publish_time >= ? AND (publish_time, content_hash) < (?, ?)
+            ORDER BY publish_time DESC, content_hash DESC 
             LIMIT ?
-        ''', (date_str, limit))
+        ''', (start, *before, limit))
         
         news_list = c.fetchall()
-        conn.close()
         
-        print(f"\n=== {date_str} 的新闻 ({len(news_list)} 条) ===\n")
-        
-        for i, (content_hash, title, summary, pub_time, keywords, file_path) in enumerate(news_list, 1):
-            print(f"{i}. {title}")
-            print(f"   时间: {pub_time}")
-            print(f"   关键词: {keywords}")
-            print(f"   哈希: {content_hash}")
-            print(f"   详细内容: {'✅' if file_path else '❌'}")
-            print()
+        self._print_news_list(f"{date_str} 的新闻 ({len(news_list)} 条)", news_list)
         
         return news_list
     
     def search_news(self, keyword, limit=20):
         """搜索新闻"""
-        conn = sqlite3.connect(self.db_path)
-        c = conn.cursor()
+        c = self.conn.cursor()
         
-        c.execute('''
-            SELECT content_hash, title, summary, publish_time, keywords, content_file_path
-            FROM news 
-            WHERE title LIKE ? OR summary LIKE ? OR keywords LIKE ?
-            ORDER BY publish_time DESC 
-            LIMIT ?
-        ''', (f'%{keyword}%', f'%{keyword}%', f'%{keyword}%', limit))
+        # trigram 全文索引至少需要3个字符，更短的关键词退回LIKE匹配
+        if len(keyword) >= 3 and self._has_fulltext_index(c):
+            c.execute(f'''
+                SELECT n.content_hash, n.title, n.summary, n.publish_time, n.keywords,
+                       n.content_file_path IS NOT NULL OR {self._blob_column} IS NOT NULL AS has_detail
+                FROM news_fts f JOIN news n ON n.rowid = f.rowid
+                WHERE news_fts MATCH ?
+                ORDER BY n.publish_time DESC 
+                LIMIT ?
+            ''', ('"' + keyword.replace('"', '""') + '"', limit))
+        else:
+            c.execute(f'''
+                SELECT content_hash, title, summary, publish_time, keywords,
+                       content_file_path IS NOT NULL OR {self._blob_column} IS NOT NULL AS has_detail
+                FROM news 
+                WHERE title LIKE ? OR summary LIKE ? OR keywords LIKE ?
+                ORDER BY publish_time DESC 
+                LIMIT ?
+            ''', (f'%{keyword}%', f'%{keyword}%', f'%{keyword}%', limit))
         
         results = c.fetchall()
-        conn.close()
         
-        print(f"\n=== 搜索 '{keyword}' 结果 ({len(results)} 条) ===\n")
-        
-        for i, (content_hash, title, summary, pub_time, keywords, file_path) in enumerate(results, 1):
-            print(f"{i}. {title}")
-            print(f"   时间: {pub_time}")
-            print(f"   关键词: {keywords}")
-            print(f"   哈希: {content_hash}")
-            print(f"   详细内容: {'✅' if file_path else '❌'}")
-            print()
+        self._print_news_list(f"搜索 '{keyword}' 结果 ({len(results)} 条)", results)
         
         return results
     
     def read_detailed_content(self, content_hash):
-        """读取详细内容"""
-        conn = sqlite3.connect(self.db_path)
-        c = conn.cursor()
+        """读取详细内容并输出到终端，成功返回True"""
+        c = self.conn.cursor()
         
-        c.execute('SELECT content_file_path FROM news WHERE content_hash = ?', (content_hash,))
+        c.execute(f'SELECT {self._blob_column} AS content_blob, content_file_path FROM news WHERE content_hash = ?',
+                  (content_hash,))
         result = c.fetchone()
-        conn.close()
         
-        if not result or not result[0]:
+        if not result or not (result['content_blob'] or result['content_file_path']):
             print("未找到详细内容")
-            return None
-        
-        file_path = os.path.join(self.content_base_dir, result[0])
+            return False
         
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-                print(f"\n=== 详细内容 ===\n")
-                print(content)
-                print("\n" + "="*50)
-                return content
+            print(f"\n=== 详细内容 ===\n")
+            if result['content_blob']:
+                sys.stdout.write(zlib.decompress(result['content_blob']).decode('utf-8'))
+            else:
+                # 早期记录的内容保存在 .txt 文件中，分块复制到标准输出
+                file_path = os.path.join(self.content_base_dir, result['content_file_path'])
+                with open(file_path, 'r', encoding='utf-8') as f:
+                    shutil.copyfileobj(f, sys.stdout)
+            print()
+            print("\n" + "="*50)
+            return True
         except Exception as e:
             print(f"读取详细内容失败: {e}")
-            return None
+            return False
     
     def get_statistics(self):
         """获取统计信息"""
-        conn = sqlite3.connect(self.db_path)
-        c = conn.cursor()
+        c = self.conn.cursor()
         
         stats = {}
         
         c.execute('SELECT COUNT(*) FROM news')
         stats['total_count'] = c.fetchone()[0]
         
-        c.execute('SELECT COUNT(*) FROM news WHERE content_file_path IS NOT NULL')
+        c.execute(f'SELECT COUNT(*) FROM news WHERE content_file_path IS NOT NULL OR {self._blob_column} IS NOT NULL')
         stats['detailed_count'] = c.fetchone()[0]
         
         c.execute('SELECT MIN(publish_time), MAX(publish_time) FROM news')
@@ -143,8 +193,6 @@ class NewsViewer:
         ''')
         stats['recent_days'] = c.fetchall()
         
-        conn.close()
-        
         print(f"\n=== 数据库统计 ===")
         print(f"总新闻数: {stats['total_count']} 条")
         print(f"含详细内容: {stats['detailed_count']} 条")
@@ -155,6 +203,18 @@ class NewsViewer:
         
         return stats
 
+def browse_pages(fetch_page, limit):
+    """分页浏览，fetch_page(before) 返回一页结果，以末条的 (发布时间, 内容哈希) 作为下一页的起点"""
+    before = None
+    while True:
+        news_list = fetch_page(before)
+        if not news_list or len(news_list) < limit:
+            break
+        if input("输入 n 查看下一页，回车返回: ").strip().lower() != 'n':
+            break
+        last = news_list[-1]
+        before = (last['publish_time'], last['content_hash'])
+
 def main():
     """查看器主函数 - 提供交互式菜单"""
     viewer = NewsViewer()
@@ -176,18 +236,18 @@ def main():
         if choice == '1':
             try:
                 limit = int(input("显示数量 (默认10): ") or "10")
-                viewer.view_recent_news(limit)
             except ValueError:
-                viewer.view_recent_news()
+                limit = 10
+            browse_pages(lambda before: viewer.view_recent_news(limit, before), limit)
                 
         elif choice == '2':
             date_str = input("请输入日期 (YYYY-MM-DD): ").strip()
             if date_str:
                 try:
                     limit = int(input("显示数量 (默认20): ") or "20")
-                    viewer.view_news_by_date(date_str, limit)
                 except ValueError:
-                    viewer.view_news_by_date(date_str)
+                    limit = 20
+                browse_pages(lambda before: viewer.view_news_by_date(date_str, limit, before), limit)
             else:
                 print("日期不能为空")
                 
@@ -201,7 +261,7 @@ def main():
                         # 提供查看详细内容的选项
                         idx = input("输入编号查看详细内容 (0返回): ").strip()
                         if idx.isdigit() and 1 <= int(idx) <= len(results):
-                            content_hash = results[int(idx)-1][0]
+                            content_hash = results[int(idx)-1]['content_hash']
                             viewer.read_detailed_content(content_hash)
                 except ValueError:
                     viewer.search_news(keyword)
@@ -220,6 +280,7 @@ def main():
             
         elif choice == '0':
             print("再见！")
+            viewer.close()
             break
             
         else: